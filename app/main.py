@@ -5,16 +5,273 @@ Platform for reliable AI agents (Fork of LangChain)
 
 import os
 import time
+import asyncio
 import base64
-import json
+import gzip
+import hashlib
+import itertools
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable
 
+import anyio
+import brotli
 import httpx
-from fastapi import FastAPI, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
+import minify_html
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Defined locally because ``fastapi.responses.ORJSONResponse`` is deprecated
+    in recent FastAPI releases.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> frozenset[str]:
+    """Content codings an ``Accept-Encoding`` value allows, minus any at ``q=0``.
+
+    Clients send only a handful of distinct values, so parses are cached.
+    """
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        coding = coding.strip().lower()
+        if coding and q > 0:
+            accepted.add(coding)
+    return frozenset(accepted)
+
+
+def _if_none_match_hits(if_none_match: str, opaque_tag: str) -> bool:
+    """Whether ``If-None-Match`` matches ``opaque_tag`` (RFC 9110 §13.1.2).
+
+    ``*`` matches any current representation; listed tags are compared
+    weakly, so ``W/"x"`` and ``"x"`` both match ``"x"``.
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+class PrecompressedBody:
+    """A constant response body, encoded and compressed once at import time.
+
+    ``response()`` negotiates brotli/gzip from ``Accept-Encoding`` and answers
+    ``If-None-Match`` revalidations with a bodiless 304.
+    """
+
+    def __init__(self, content: str | bytes, media_type: str, cache_control: str):
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        self.media_type = media_type
+        self.identity = body
+        self.gzip = gzip.compress(body, 9)
+        self.br = brotli.compress(body, quality=11)
+        # Weak validator: the brotli, gzip and identity variants share it.
+        self.opaque_tag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        self.etag = "W/" + self.opaque_tag
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+    def response(self, request: Request) -> Response:
+        if _if_none_match_hits(request.headers.get("if-none-match", ""), self.opaque_tag):
+            return Response(status_code=304, headers=self.headers)
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        if "br" in accepted:
+            return Response(self.br, media_type=self.media_type, headers={**self.headers, "Content-Encoding": "br"})
+        if "gzip" in accepted:
+            return Response(self.gzip, media_type=self.media_type, headers={**self.headers, "Content-Encoding": "gzip"})
+        return Response(self.identity, media_type=self.media_type, headers=self.headers)
+
+
+class TimestampedJSON:
+    """A constant JSON object serialized once, plus one trailing timestamp field.
+
+    Only the timestamp is encoded per request; it is spliced between the
+    precomputed prefix and the closing ``"}``.
+    """
+
+    def __init__(self, payload: dict, timestamp_field: str):
+        self.prefix = orjson.dumps(payload)[:-1] + b',"' + timestamp_field.encode("utf-8") + b'":"'
+
+    def response(self) -> Response:
+        return Response(self.prefix + _now_iso_bytes() + b'"}', media_type="application/json")
+
+
+_START_TIME = time.monotonic()
+# next() on an itertools.count is a single C call and atomic under the GIL.
+_request_count = itertools.count()
+# Liveness probes would otherwise dominate the count.
+_UNCOUNTED_PATHS = frozenset({"/health", "/static/frames/{name}"})
+
+
+def _requests_total() -> int:
+    # itertools.count exposes its position only through repr(): "count(n)".
+    return int(repr(_request_count)[6:-1])
+
+
+class CountingRoute(APIRoute):
+    """APIRoute that bumps the request counter before running its endpoint.
+
+    Counting here instead of in an HTTP middleware keeps the extra
+    ``call_next`` frame off ``/static`` mounts and uncounted routes.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        if self.path in _UNCOUNTED_PATHS:
+            return handler
+
+        async def counted_handler(request: Request) -> Response:
+            next(_request_count)
+            return await handler(request)
+
+        return counted_handler
+
+
+# raw_path -> (builder, counted), filled in once the prebuilt bodies below exist.
+_FAST_GET_ROUTES: dict[bytes, tuple[Callable[[Request], Response], bool]] = {}
+
+
+class FastPathMiddleware:
+    """Serve prebuilt GET/HEAD responses straight from a ``raw_path`` lookup.
+
+    A hit skips Starlette's regex route matching and FastAPI's request
+    handling; any other request falls through to the app untouched. For
+    HEAD the server drops the body and keeps the GET headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            entry = _FAST_GET_ROUTES.get(scope.get("raw_path"))
+            if entry is not None:
+                build, counted = entry
+                if counted:
+                    next(_request_count)
+                await build(Request(scope))(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+_CORS_PREFLIGHT_HEADERS = [
+    (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers"),
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"86400"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+
+
+class OpenCORSMiddleware:
+    """CORS for any origin with credentials, answered from prebuilt headers.
+
+    Follows Starlette's cookie-aware ``CORSMiddleware`` configured with
+    ``allow_origins=["*"]``, ``allow_credentials=True`` and all methods and
+    headers. Simple requests that carry a ``Cookie`` get their Origin echoed
+    with ``Access-Control-Allow-Credentials`` (browsers reject ``*`` on
+    credentialed requests); all others get ``Access-Control-Allow-Origin: *``.
+    Preflights, which never carry cookies, echo the Origin and never reach
+    the app.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = requested_method = requested_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+            elif name == b"access-control-request-method":
+                requested_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if scope["method"] == "OPTIONS" and origin is not None and requested_method is not None:
+            headers = [*_CORS_PREFLIGHT_HEADERS, (b"access-control-allow-origin", origin)]
+            if requested_headers is not None:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                for i, (name, value) in enumerate(headers):
+                    if name == b"vary":
+                        headers[i] = (name, value + b", Origin")
+                        break
+                else:
+                    headers.append((b"vary", b"Origin"))
+                if origin is not None:
+                    if has_cookie:
+                        headers.append((b"access-control-allow-origin", origin))
+                        headers.append((b"access-control-allow-credentials", b"true"))
+                    else:
+                        headers.append((b"access-control-allow-origin", b"*"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Starlette runs sync endpoints and file I/O on anyio's threadpool; its
+    # default of 40 threads would queue bursts of blocking work.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    # One pooled client per process so health-probe calls reuse
+    # keep-alive connections instead of paying a TLS handshake per request.
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+    )
+    # SSO verify and token calls all go to one host; a dedicated HTTP/2 client
+    # keeps them multiplexed on its own connection, unaffected by slow
+    # health probes holding slots in the shared pool.
+    app.state.sso_http = httpx.AsyncClient(
+        base_url=SSO_ISSUER,
+        http2=True,
+        timeout=httpx.Timeout(5.0, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0),
+    )
+    yield
+    await app.state.sso_http.aclose()
+    await app.state.http.aclose()
+
 
 app = FastAPI(
     title="Orcest.ai",
@@ -23,18 +280,14 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
+app.router.route_class = CountingRoute
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Mount static files for animation frames
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+# Added before CORS so it sits inside it and fast-path hits still get CORS headers.
+app.add_middleware(FastPathMiddleware)
+app.add_middleware(OpenCORSMiddleware)
 
 RAINYMODEL_BASE_URL = os.getenv("RAINYMODEL_BASE_URL", "https://rm.orcest.ai/v1")
 SSO_ISSUER = os.getenv("SSO_ISSUER", "https://login.orcest.ai")
@@ -42,8 +295,47 @@ SSO_CLIENT_ID = os.getenv("SSO_CLIENT_ID", "orcest")
 SSO_CLIENT_SECRET = os.getenv("SSO_CLIENT_SECRET")
 SSO_CALLBACK_URL = os.getenv("SSO_CALLBACK_URL", "https://orcest.ai/auth/callback")
 ORCEST_SSO_COOKIE = "orcest_sso_token"
-
-LANGCHAIN_ECOSYSTEM = {
+# Written by the Docker build (relative to the working directory, like
+# ANIMATION_FRAMES_DIR).
+BUILD_TIMESTAMP_FILE = "BUILD_TIMESTAMP"
+
+
+def _manifest_updated_at() -> str:
+    """The manifest's updated_at: one value per deploy, shared by every worker.
+
+    Taken from RAINYMODEL_MANIFEST_UPDATED_AT, else the image's build stamp.
+    A source checkout without either falls back to this file's mtime; on
+    Render (which sets RENDER) a missing stamp is a broken build, so fail.
+    """
+    value = os.getenv("RAINYMODEL_MANIFEST_UPDATED_AT")
+    if value:
+        return value
+    try:
+        with open(BUILD_TIMESTAMP_FILE) as f:
+            value = f.read().strip()
+    except FileNotFoundError:
+        value = ""
+    if value:
+        return value
+    if os.getenv("RENDER"):
+        raise RuntimeError(f"{BUILD_TIMESTAMP_FILE} is missing and RAINYMODEL_MANIFEST_UPDATED_AT is not set")
+    return datetime.fromtimestamp(os.path.getmtime(__file__), timezone.utc).isoformat()
+
+
+RAINYMODEL_MANIFEST_UPDATED_AT = _manifest_updated_at()
+
+# Verified tokens, keyed by sha256(token) so raw tokens are never held in
+# memory, mapped to a monotonic expiry. The short TTL bounds how long a
+# revoked token keeps working.
+SSO_TOKEN_CACHE_TTL = 30.0
+SSO_TOKEN_CACHE_MAX = 10_000
+_sso_token_cache: dict[bytes, float] = {}
+# Verify calls currently in flight, keyed like _sso_token_cache.
+_sso_verify_inflight: dict[bytes, asyncio.Future] = {}
+
+# Read-only: the JSON payloads below are serialized from these once at import,
+# so a later mutation would never reach clients.
+LANGCHAIN_ECOSYSTEM = MappingProxyType({
     "deep_agents": {
         "name": "Deep Agents",
         "description": "Build agents that can plan, use subagents, and leverage file systems for complex tasks.",
@@ -69,9 +361,9 @@ LANGCHAIN_ECOSYSTEM = {
         "description": "Purpose-built deployment for long-running, stateful workflows with fast iteration.",
         "url": "https://docs.langchain.com/langsmith/deployments",
     },
-}
+})
 
-LANGCHAIN_ORCEST_ENDPOINTS = {
+LANGCHAIN_ORCEST_ENDPOINTS = MappingProxyType({
     "ecosystem": "https://orcest.ai/api/langchain/ecosystem",
     "health": "https://orcest.ai/api/langchain/health",
     "run_agent": "https://orcest.ai/api/langchain/agent/run",
@@ -84,14 +376,9 @@ LANGCHAIN_ORCEST_ENDPOINTS = {
     "langchain_ui": "https://orcest.ai/orchestration/langchain",
     "rainymodel_ui": "https://orcest.ai/orchestration/rainymodel",
     "rainymodel_manifest_schema": "https://orcest.ai/api/rainymodel/langchain-manifest/schema",
-}
+})
 
 
-class LangChainAgentRunRequest(BaseModel):
-    query: str
-    agent_type: str = "general"
-    metadata: dict | None = None
-
 LANDING_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -154,7 +441,7 @@ body{font-family:'Inter',system-ui,-apple-system,sans-serif;background:var(--bg-
 .stat-label{font-size:0.9rem;color:var(--text-muted);text-transform:uppercase;letter-spacing:1px}
 
 /* Ecosystem Section */
-.ecosystem{padding:100px 20px;background:linear-gradient(180deg,var(--bg-primary) 0%,var(--bg-secondary) 100%)}
+.ecosystem{padding:100px 20px;background:linear-gradient(180deg,var(--bg-primary) 0%,var(--bg-secondary) 100%);content-visibility:auto;contain-intrinsic-size:auto 1600px}
 .ecosystem-container{max-width:1400px;margin:0 auto}
 .section-header{text-align:center;margin-bottom:80px}
 .section-title{font-size:3rem;font-weight:800;color:var(--text-primary);margin-bottom:16px}
@@ -183,7 +470,7 @@ body{font-family:'Inter',system-ui,-apple-system,sans-serif;background:var(--bg-
 .tag-status{background:rgba(74,222,128,0.15);color:var(--accent-green)}
 
 /* Features Section */
-.features{padding:100px 20px;background:var(--bg-primary)}
+.features{padding:100px 20px;background:var(--bg-primary);content-visibility:auto;contain-intrinsic-size:auto 700px}
 .features-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(300px,1fr));gap:40px;max-width:1200px;margin:0 auto}
 .feature{text-align:center;padding:40px 20px}
 .feature-icon{width:80px;height:80px;margin:0 auto 24px;background:linear-gradient(135deg,var(--accent-blue),var(--accent-purple));border-radius:20px;display:flex;align-items:center;justify-content:center;font-size:2rem}
@@ -191,7 +478,7 @@ body{font-family:'Inter',system-ui,-apple-system,sans-serif;background:var(--bg-
 .feature p{color:var(--text-muted);line-height:1.6}
 
 /* Footer */
-.footer{background:var(--bg-secondary);border-top:1px solid var(--border-color);padding:60px 20px 40px}
+.footer{background:var(--bg-secondary);border-top:1px solid var(--border-color);padding:60px 20px 40px;content-visibility:auto;contain-intrinsic-size:auto 400px}
 .footer-container{max-width:1200px;margin:0 auto}
 .footer-content{display:grid;grid-template-columns:repeat(auto-fit,minmax(250px,1fr));gap:40px;margin-bottom:40px}
 .footer-section h4{color:var(--text-primary);font-size:1.2rem;font-weight:700;margin-bottom:20px}
@@ -208,20 +495,6 @@ body{font-family:'Inter',system-ui,-apple-system,sans-serif;background:var(--bg-
 </style>
 <script>
 document.addEventListener('DOMContentLoaded', function() {
-    // Preload animation frames
-    const keyFrames = [
-        '/static/frames/key-frame-001.jpg',
-        '/static/frames/key-frame-050.jpg', 
-        '/static/frames/key-frame-100.jpg',
-        '/static/frames/key-frame-150.jpg',
-        '/static/frames/key-frame-200.jpg'
-    ];
-    
-    keyFrames.forEach(src => {
-        const img = new Image();
-        img.src = src;
-    });
-    
     // Handle reduced motion
     if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) {
         const animationEl = document.querySelector('.hero-bg-animation');
@@ -520,14 +793,62 @@ document.addEventListener('DOMContentLoaded', function() {
 </html>"""
 
 
-@app.get("/health")
+_HEALTH_JSON = orjson.dumps({"status": "healthy", "service": "orcest.ai"})
+
+
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
-    return {"status": "healthy", "service": "orcest.ai"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def landing_page():
-    return HTMLResponse(content=LANDING_HTML)
+# Minified once at import; only the minified bytes are compressed and served.
+_LANDING_PAGE = PrecompressedBody(
+    minify_html.minify(LANDING_HTML, minify_css=True, minify_js=True),
+    "text/html; charset=utf-8",
+    "public, max-age=3600",
+)
+
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
+async def landing_page(request: Request):
+    return _LANDING_PAGE.response(request)
+
+
+ANIMATION_FRAMES_DIR = "app/static/frames"
+# Frame URLs carry no content hash, so a replaced frame must reach browsers
+# without a rename: cache for a day, then revalidate against the ETag.
+_FRAME_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _load_animation_frames() -> dict[str, tuple[bytes, str]]:
+    frames = {}
+    for name in os.listdir(ANIMATION_FRAMES_DIR):
+        if name.endswith(".jpg"):
+            with open(os.path.join(ANIMATION_FRAMES_DIR, name), "rb") as f:
+                body = f.read()
+            frames[name] = (body, '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"')
+    return frames
+
+
+# The landing-page animation frames (~1.6 MB) are held in memory so serving
+# them costs no stat/open/read syscalls.
+_ANIMATION_FRAMES = _load_animation_frames()
+
+
+@app.api_route("/static/frames/{name}", methods=["GET", "HEAD"])
+async def animation_frame(name: str, request: Request):
+    frame = _ANIMATION_FRAMES.get(name)
+    if frame is None:
+        return Response(status_code=404)
+    body, etag = frame
+    headers = {"ETag": etag, "Cache-Control": _FRAME_CACHE_CONTROL}
+    if _if_none_match_hits(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="image/jpeg", headers=headers)
+
+
+# Mount static files for anything not served from the frame cache above
+app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 
 ECOSYSTEM_SERVICES = [
@@ -540,19 +861,41 @@ ECOSYSTEM_SERVICES = [
     {"name": "status.orcest.ai", "url": "https://status-orcest-ai.onrender.com/health"},
 ]
 
-_metrics = {"requests": 0, "start_time": time.time()}
+# The last probe pass: monotonic time it finished and the serialized response.
+# Dashboards poll /ecosystem/health far more often than services change
+# state, so polls within the TTL are answered from it; the lock makes
+# concurrent polls on an expired entry share a single fan-out.
+ECOSYSTEM_HEALTH_TTL = 5.0
+_ecosystem_health_cache = [float("-inf"), b""]
+_ecosystem_health_lock = asyncio.Lock()
 
+_now_iso_cache = [float("-inf"), "", b""]
 
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    _metrics["requests"] += 1
-    response = await call_next(request)
-    return response
 
+def _refresh_now_iso() -> None:
+    # The refresh guard runs on the monotonic clock so a wall-clock step
+    # backwards cannot freeze the cached value.
+    now = time.monotonic()
+    if now - _now_iso_cache[0] >= 1.0:
+        _now_iso_cache[0] = now
+        _now_iso_cache[1] = datetime.now(timezone.utc).isoformat()
+        _now_iso_cache[2] = _now_iso_cache[1].encode("utf-8")
 
-@app.get("/api/info")
-async def api_info():
-    return {
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp, reformatted at most once per second."""
+    _refresh_now_iso()
+    return _now_iso_cache[1]
+
+
+def _now_iso_bytes() -> bytes:
+    """``_now_iso()`` already UTF-8 encoded, for splicing into prebuilt JSON."""
+    _refresh_now_iso()
+    return _now_iso_cache[2]
+
+
+_API_INFO_JSON = orjson.dumps(
+    {
         "platform": "orcest.ai",
         "description": "Intelligent LLM Orchestration Platform",
         "services": {
@@ -565,35 +908,55 @@ async def api_info():
             "langchain_ecosystem": "https://orcest.ai/api/langchain/ecosystem",
         },
         "rainymodel_api": RAINYMODEL_BASE_URL,
-        "langchain_api_endpoints": LANGCHAIN_ORCEST_ENDPOINTS,
+        "langchain_api_endpoints": dict(LANGCHAIN_ORCEST_ENDPOINTS),
     }
+)
 
 
-@app.get("/api/langchain/health")
-async def langchain_health():
-    return {
+@app.api_route("/api/info", methods=["GET", "HEAD"])
+async def api_info():
+    return Response(_API_INFO_JSON, media_type="application/json")
+
+
+_LANGCHAIN_HEALTH = TimestampedJSON(
+    {
         "status": "healthy",
         "provider": "orcest.ai",
         "service": "langchain-api",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "endpoints": LANGCHAIN_ORCEST_ENDPOINTS,
-    }
+        "endpoints": dict(LANGCHAIN_ORCEST_ENDPOINTS),
+    },
+    "timestamp",
+)
 
 
-@app.get("/api/langchain/ecosystem")
-async def langchain_ecosystem():
-    return {
-        "name": "LangChain Ecosystem via Orcest.ai",
-        "components": LANGCHAIN_ECOSYSTEM,
-        "orcest_endpoints": LANGCHAIN_ORCEST_ENDPOINTS,
-        "notes": {
-            "integration_mode": "orcest.ai acts as unified discovery and orchestration surface",
-            "rainymodel_connection": "RainyModel can consume Orcest LangChain endpoint manifest",
-        },
-    }
+@app.api_route("/api/langchain/health", methods=["GET", "HEAD"])
+async def langchain_health():
+    return _LANGCHAIN_HEALTH.response()
+
+
+_LANGCHAIN_ECOSYSTEM = PrecompressedBody(
+    orjson.dumps(
+        {
+            "name": "LangChain Ecosystem via Orcest.ai",
+            "components": dict(LANGCHAIN_ECOSYSTEM),
+            "orcest_endpoints": dict(LANGCHAIN_ORCEST_ENDPOINTS),
+            "notes": {
+                "integration_mode": "orcest.ai acts as unified discovery and orchestration surface",
+                "rainymodel_connection": "RainyModel can consume Orcest LangChain endpoint manifest",
+            },
+        }
+    ),
+    "application/json",
+    "public, max-age=60",
+)
+
 
+@app.api_route("/api/langchain/ecosystem", methods=["GET", "HEAD"])
+async def langchain_ecosystem(request: Request):
+    return _LANGCHAIN_ECOSYSTEM.response(request)
 
-def _langchain_component_response(component_key: str):
+
+def _langchain_component_payload(component_key: str) -> dict:
     component = LANGCHAIN_ECOSYSTEM[component_key]
     return {
         "component": component,
@@ -608,37 +971,42 @@ def _langchain_component_response(component_key: str):
             "recommended_upstream": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
             "component_hint": component_key,
         },
-        "updated_at": datetime.now(timezone.utc).isoformat(),
     }
 
 
-@app.get("/api/langchain/deep-agents")
-async def langchain_deep_agents():
-    return _langchain_component_response("deep_agents")
-
-
-@app.get("/api/langchain/langgraph")
-async def langchain_langgraph():
-    return _langchain_component_response("langgraph")
+# Keyed by URL slug (the last path segment of each component's endpoint), so
+# one parameterized route serves all five components with a dict lookup.
+_LANGCHAIN_COMPONENTS = {
+    LANGCHAIN_ORCEST_ENDPOINTS[key].rsplit("/", 1)[1]: TimestampedJSON(_langchain_component_payload(key), "updated_at")
+    for key in LANGCHAIN_ECOSYSTEM
+}
 
 
-@app.get("/api/langchain/integrations")
-async def langchain_integrations():
-    return _langchain_component_response("integrations")
+@app.api_route("/api/langchain/{component}", methods=["GET", "HEAD"])
+async def langchain_component(component: str):
+    entry = _LANGCHAIN_COMPONENTS.get(component)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown LangChain component")
+    return entry.response()
 
 
-@app.get("/api/langchain/langsmith")
-async def langchain_langsmith():
-    return _langchain_component_response("langsmith")
+class LangChainAgentRunRequest(msgspec.Struct):
+    query: str
+    agent_type: str = "general"
+    metadata: dict | None = None
 
 
-@app.get("/api/langchain/langsmith-deployment")
-async def langchain_langsmith_deployment():
-    return _langchain_component_response("langsmith_deployment")
+# msgspec parses and type-checks the body in a single C pass, without the
+# Pydantic model or FastAPI's body dependency machinery.
+_agent_run_decoder = msgspec.json.Decoder(LangChainAgentRunRequest)
 
 
 @app.post("/api/langchain/agent/run")
-async def langchain_agent_run(payload: LangChainAgentRunRequest):
+async def langchain_agent_run(request: Request):
+    try:
+        payload = _agent_run_decoder.decode(await request.body())
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from None
     return {
         "status": "accepted",
         "engine": "langchain-orcest",
@@ -652,125 +1020,160 @@ async def langchain_agent_run(payload: LangChainAgentRunRequest):
     }
 
 
-@app.get("/api/rainymodel/langchain-manifest")
-async def rainymodel_langchain_manifest():
-    return {
-        "manifest_version": "1.1.0",
-        "schema_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["rainymodel_manifest_schema"],
-        "consumer": "RainyModel",
-        "target": "Orcest LangChain API",
-        "recommended_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
-        "health_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["health"],
-        "ecosystem_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["ecosystem"],
-        "routing_policy_hint": "RainyModel should include Orcest LangChain API as one upstream endpoint",
-        "auth": {
-            "required": True,
-            "mode": "SSO for console, API key for service-to-service",
-            "issuer": SSO_ISSUER,
-        },
-        "capabilities": {
-            "supports_component_discovery": True,
-            "supports_health_probe": True,
-            "supports_agent_execution": True,
-            "supports_ui_console": True,
-        },
-        "examples": {
-            "agent_run_post": {
-                "url": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
-                "method": "POST",
-                "body": {"query": "Plan a multi-step migration", "agent_type": "general", "metadata": {"source": "RainyModel"}},
+_RAINYMODEL_MANIFEST = PrecompressedBody(
+    orjson.dumps(
+        {
+            "manifest_version": "1.1.0",
+            "schema_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["rainymodel_manifest_schema"],
+            "consumer": "RainyModel",
+            "target": "Orcest LangChain API",
+            "recommended_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
+            "health_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["health"],
+            "ecosystem_endpoint": LANGCHAIN_ORCEST_ENDPOINTS["ecosystem"],
+            "routing_policy_hint": "RainyModel should include Orcest LangChain API as one upstream endpoint",
+            "auth": {
+                "required": True,
+                "mode": "SSO for console, API key for service-to-service",
+                "issuer": SSO_ISSUER,
             },
-            "health_get": {
-                "url": LANGCHAIN_ORCEST_ENDPOINTS["health"],
-                "method": "GET",
-            },
-        },
-        "access_map": {
-            "deep_agents": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["deep_agents"],
-                "method": "GET",
-                "description": "Planning-oriented agent access with subagent and filesystem patterns.",
+            "capabilities": {
+                "supports_component_discovery": True,
+                "supports_health_probe": True,
+                "supports_agent_execution": True,
+                "supports_ui_console": True,
             },
-            "langgraph": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langgraph"],
-                "method": "GET",
-                "description": "Reliable low-level graph orchestration and stateful workflow access.",
+            "examples": {
+                "agent_run_post": {
+                    "url": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
+                    "method": "POST",
+                    "body": {"query": "Plan a multi-step migration", "agent_type": "general", "metadata": {"source": "RainyModel"}},
+                },
+                "health_get": {
+                    "url": LANGCHAIN_ORCEST_ENDPOINTS["health"],
+                    "method": "GET",
+                },
             },
-            "integrations": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["integrations"],
-                "method": "GET",
-                "description": "Provider/tool integration catalog for model and toolkit discovery.",
+            "access_map": {
+                "deep_agents": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["deep_agents"],
+                    "method": "GET",
+                    "description": "Planning-oriented agent access with subagent and filesystem patterns.",
+                },
+                "langgraph": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langgraph"],
+                    "method": "GET",
+                    "description": "Reliable low-level graph orchestration and stateful workflow access.",
+                },
+                "integrations": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["integrations"],
+                    "method": "GET",
+                    "description": "Provider/tool integration catalog for model and toolkit discovery.",
+                },
+                "langsmith": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langsmith"],
+                    "method": "GET",
+                    "description": "Observability, eval, and production debugging access surface.",
+                },
+                "langsmith_deployment": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langsmith_deployment"],
+                    "method": "GET",
+                    "description": "Deployment and scale guidance for long-running stateful agent workflows.",
+                },
+                "agent_run": {
+                    "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
+                    "method": "POST",
+                    "description": "Unified execution entrypoint that RainyModel can call as an upstream.",
+                },
             },
-            "langsmith": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langsmith"],
-                "method": "GET",
-                "description": "Observability, eval, and production debugging access surface.",
-            },
-            "langsmith_deployment": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["langsmith_deployment"],
-                "method": "GET",
-                "description": "Deployment and scale guidance for long-running stateful agent workflows.",
-            },
-            "agent_run": {
-                "endpoint": LANGCHAIN_ORCEST_ENDPOINTS["run_agent"],
-                "method": "POST",
-                "description": "Unified execution entrypoint that RainyModel can call as an upstream.",
+            "ui_console": LANGCHAIN_ORCEST_ENDPOINTS["langchain_ui"],
+            "rainymodel_console": LANGCHAIN_ORCEST_ENDPOINTS["rainymodel_ui"],
+            "updated_at": RAINYMODEL_MANIFEST_UPDATED_AT,
+        }
+    ),
+    "application/json",
+    "public, max-age=60",
+)
+
+
+@app.api_route("/api/rainymodel/langchain-manifest", methods=["GET", "HEAD"])
+async def rainymodel_langchain_manifest(request: Request):
+    return _RAINYMODEL_MANIFEST.response(request)
+
+
+_MANIFEST_SCHEMA = PrecompressedBody(
+    orjson.dumps(
+        {
+            "name": "RainyModel LangChain Manifest Schema",
+            "version": "1.1.0",
+            "required_fields": [
+                "manifest_version",
+                "consumer",
+                "target",
+                "recommended_endpoint",
+                "health_endpoint",
+                "ecosystem_endpoint",
+                "access_map",
+                "updated_at",
+            ],
+            "access_map_item_schema": {
+                "endpoint": "string (absolute URL)",
+                "method": "GET|POST",
+                "description": "string",
             },
-        },
-        "ui_console": LANGCHAIN_ORCEST_ENDPOINTS["langchain_ui"],
-        "rainymodel_console": LANGCHAIN_ORCEST_ENDPOINTS["rainymodel_ui"],
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-    }
+            "notes": "RainyModel can validate manifest payload shape before consuming endpoint map.",
+        }
+    ),
+    "application/json",
+    "public, max-age=300",
+)
+
+
+@app.api_route("/api/rainymodel/langchain-manifest/schema", methods=["GET", "HEAD"])
+async def rainymodel_langchain_manifest_schema(request: Request):
+    return _MANIFEST_SCHEMA.response(request)
+
 
+async def _probe_ecosystem(client: httpx.AsyncClient) -> dict:
+    async def probe(svc):
+        try:
+            # Only the status code matters, so skip downloading the body;
+            # services that reject HEAD get a GET whose body is never read.
+            resp = await client.head(svc["url"], follow_redirects=True, timeout=10.0)
+            if resp.status_code in (405, 501):
+                async with client.stream("GET", svc["url"], follow_redirects=True, timeout=10.0) as resp:
+                    pass
+            return {"status": "operational" if resp.status_code < 400 else "degraded", "code": resp.status_code}
+        except Exception:
+            return {"status": "down", "code": 0}
 
-@app.get("/api/rainymodel/langchain-manifest/schema")
-async def rainymodel_langchain_manifest_schema():
+    # Probe all services concurrently: the pass takes as long as the slowest
+    # service instead of the sum of all of them.
+    statuses = await asyncio.gather(*(probe(svc) for svc in ECOSYSTEM_SERVICES))
     return {
-        "name": "RainyModel LangChain Manifest Schema",
-        "version": "1.1.0",
-        "required_fields": [
-            "manifest_version",
-            "consumer",
-            "target",
-            "recommended_endpoint",
-            "health_endpoint",
-            "ecosystem_endpoint",
-            "access_map",
-            "updated_at",
-        ],
-        "access_map_item_schema": {
-            "endpoint": "string (absolute URL)",
-            "method": "GET|POST",
-            "description": "string",
-        },
-        "notes": "RainyModel can validate manifest payload shape before consuming endpoint map.",
+        "overall": "operational" if all(v["status"] == "operational" for v in statuses) else "degraded",
+        "services": {svc["name"]: status for svc, status in zip(ECOSYSTEM_SERVICES, statuses)},
+        "checked_at": _now_iso(),
     }
 
 
 @app.get("/ecosystem/health")
-async def ecosystem_health():
-    async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-        results = {}
-        for svc in ECOSYSTEM_SERVICES:
-            try:
-                resp = await client.get(svc["url"])
-                results[svc["name"]] = {"status": "operational" if resp.status_code < 400 else "degraded", "code": resp.status_code}
-            except Exception:
-                results[svc["name"]] = {"status": "down", "code": 0}
-    operational = sum(1 for v in results.values() if v["status"] == "operational")
-    return {
-        "overall": "operational" if operational == len(results) else "degraded",
-        "services": results,
-        "checked_at": datetime.now(timezone.utc).isoformat(),
-    }
+async def ecosystem_health(request: Request):
+    if time.monotonic() - _ecosystem_health_cache[0] < ECOSYSTEM_HEALTH_TTL:
+        return Response(_ecosystem_health_cache[1], media_type="application/json")
+    async with _ecosystem_health_lock:
+        # Callers that queued behind the lock find the pass already done.
+        if time.monotonic() - _ecosystem_health_cache[0] >= ECOSYSTEM_HEALTH_TTL:
+            _ecosystem_health_cache[1] = orjson.dumps(await _probe_ecosystem(request.app.state.http))
+            _ecosystem_health_cache[0] = time.monotonic()
+    return Response(_ecosystem_health_cache[1], media_type="application/json")
 
 
 @app.get("/metrics")
 async def metrics_endpoint():
-    uptime = time.time() - _metrics["start_time"]
+    uptime = time.monotonic() - _START_TIME
     return {
         "uptime_seconds": int(uptime),
-        "total_requests": _metrics["requests"],
+        "total_requests": _requests_total(),
         "service": "orcest.ai",
         "version": "1.0.0",
     }
@@ -787,24 +1190,23 @@ async def auth_callback(request: Request, response: Response, code: str = "", st
     return_to = "/orchestration"
     if state:
         try:
-            decoded = base64.urlsafe_b64decode(state + "==")
-            data = json.loads(decoded)
+            decoded = base64.urlsafe_b64decode(state + "=" * (-len(state) % 4))
+            data = orjson.loads(decoded)
             return_to = data.get("returnTo", "/orchestration")
         except Exception:
             pass
 
-    async with httpx.AsyncClient() as client:
-        token_res = await client.post(
-            f"{SSO_ISSUER}/oauth2/token",
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": SSO_CALLBACK_URL,
-                "client_id": SSO_CLIENT_ID,
-                "client_secret": SSO_CLIENT_SECRET,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    token_res = await request.app.state.sso_http.post(
+        "/oauth2/token",
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": SSO_CALLBACK_URL,
+            "client_id": SSO_CLIENT_ID,
+            "client_secret": SSO_CLIENT_SECRET,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
     if token_res.status_code != 200:
         return RedirectResponse(url=f"{SSO_ISSUER}?error=token_failed", status_code=302)
@@ -814,6 +1216,10 @@ async def auth_callback(request: Request, response: Response, code: str = "", st
     if not access_token:
         return RedirectResponse(url=f"{SSO_ISSUER}?error=no_token", status_code=302)
 
+    # The issuer has just minted this token, so the page load the redirect
+    # triggers can skip its verify round-trip when it lands on this worker.
+    _remember_sso_token(hashlib.sha256(access_token.encode("utf-8")).digest())
+
     redirect = RedirectResponse(url=return_to, status_code=302)
     redirect.set_cookie(
         key=ORCEST_SSO_COOKIE,
@@ -899,12 +1305,12 @@ pre{white-space:pre-wrap;word-break:break-word;color:#cbd5e1;font-size:.86rem}
 <h1>Orcest LangChain Console</h1>
 <p class="sub">Simple SSO-protected UI to access Deep Agents, LangGraph, Integrations, LangSmith and LangSmith Deployment through internal Orcest endpoints.</p>
 <div class="grid">
-  <div class="card"><h3>Deep Agents</h3><p>Planning, subagents, and filesystem-driven complex tasks.</p><div class="row"><button onclick="callApi('/api/langchain/deep-agents')">Open Endpoint</button></div></div>
-  <div class="card"><h3>LangGraph</h3><p>Reliable orchestration with state, memory, and HITL patterns.</p><div class="row"><button onclick="callApi('/api/langchain/langgraph')">Open Endpoint</button></div></div>
-  <div class="card"><h3>Integrations</h3><p>Providers, tools, toolkits and integration catalog access.</p><div class="row"><button onclick="callApi('/api/langchain/integrations')">Open Endpoint</button></div></div>
-  <div class="card"><h3>LangSmith</h3><p>Observability, evals, tracing, and production debugging.</p><div class="row"><button onclick="callApi('/api/langchain/langsmith')">Open Endpoint</button></div></div>
-  <div class="card"><h3>LangSmith Deployment</h3><p>Deploy and scale stateful long-running agent workflows.</p><div class="row"><button onclick="callApi('/api/langchain/langsmith-deployment')">Open Endpoint</button></div></div>
-  <div class="card"><h3>RainyModel Access Map</h3><p>Per-component RainyModel integration and endpoint mapping.</p><div class="row"><button onclick="callApi('/api/rainymodel/langchain-manifest')">Open Manifest</button></div></div>
+  <div class="card"><h3>Deep Agents</h3><p>Planning, subagents, and filesystem-driven complex tasks.</p><div class="row"><button data-path="/api/langchain/deep-agents">Open Endpoint</button></div></div>
+  <div class="card"><h3>LangGraph</h3><p>Reliable orchestration with state, memory, and HITL patterns.</p><div class="row"><button data-path="/api/langchain/langgraph">Open Endpoint</button></div></div>
+  <div class="card"><h3>Integrations</h3><p>Providers, tools, toolkits and integration catalog access.</p><div class="row"><button data-path="/api/langchain/integrations">Open Endpoint</button></div></div>
+  <div class="card"><h3>LangSmith</h3><p>Observability, evals, tracing, and production debugging.</p><div class="row"><button data-path="/api/langchain/langsmith">Open Endpoint</button></div></div>
+  <div class="card"><h3>LangSmith Deployment</h3><p>Deploy and scale stateful long-running agent workflows.</p><div class="row"><button data-path="/api/langchain/langsmith-deployment">Open Endpoint</button></div></div>
+  <div class="card"><h3>RainyModel Access Map</h3><p>Per-component RainyModel integration and endpoint mapping.</p><div class="row"><button data-path="/api/rainymodel/langchain-manifest">Open Manifest</button></div></div>
 </div>
 <div class="panel"><pre id="out">Select any component to load JSON response...</pre></div>
 <div class="toplinks row">
@@ -916,8 +1322,12 @@ pre{white-space:pre-wrap;word-break:break-word;color:#cbd5e1;font-size:.86rem}
 </div>
 </div>
 <script>
+const out = document.getElementById('out');
+document.querySelector('.grid').addEventListener('click', (e) => {
+  const btn = e.target.closest('button[data-path]');
+  if (btn) callApi(btn.dataset.path);
+});
 async function callApi(path){
-  const out = document.getElementById('out');
   out.textContent = 'Loading ' + path + ' ...';
   try {
     const res = await fetch(path, {headers: {'Accept':'application/json'}});
@@ -958,8 +1368,8 @@ pre{{white-space:pre-wrap;word-break:break-word;color:#cbd5e1;font-size:.86rem}}
 <h1>Orcest RainyModel Console</h1>
 <p class="sub">SSO dashboard for RainyModel access to Orcest LangChain APIs. Use per-component links or load manifest/schema.</p>
 <div class="grid">
-  <div class="card"><h3>Manifest</h3><p>Full RainyModel integration manifest with access map and examples.</p><div class="row"><button onclick="callApi('/api/rainymodel/langchain-manifest')">Open Manifest</button></div></div>
-  <div class="card"><h3>Manifest Schema</h3><p>Schema to validate manifest payload before consumption.</p><div class="row"><button onclick="callApi('/api/rainymodel/langchain-manifest/schema')">Open Schema</button></div></div>
+  <div class="card"><h3>Manifest</h3><p>Full RainyModel integration manifest with access map and examples.</p><div class="row"><button data-path="/api/rainymodel/langchain-manifest">Open Manifest</button></div></div>
+  <div class="card"><h3>Manifest Schema</h3><p>Schema to validate manifest payload before consumption.</p><div class="row"><button data-path="/api/rainymodel/langchain-manifest/schema">Open Schema</button></div></div>
   <div class="card"><h3>Deep Agents Access</h3><p>RainyModel mapped endpoint for planning/subagent scenarios.</p><div class="row"><a class="btn" href="/api/langchain/deep-agents" target="_blank">Open Endpoint</a></div></div>
   <div class="card"><h3>LangGraph Access</h3><p>Mapped endpoint for stateful workflow orchestration.</p><div class="row"><a class="btn" href="/api/langchain/langgraph" target="_blank">Open Endpoint</a></div></div>
   <div class="card"><h3>LangSmith Access</h3><p>Mapped endpoint for observability and evals.</p><div class="row"><a class="btn" href="/api/langchain/langsmith" target="_blank">Open Endpoint</a></div></div>
@@ -975,8 +1385,12 @@ pre{{white-space:pre-wrap;word-break:break-word;color:#cbd5e1;font-size:.86rem}}
 </div>
 </div>
 <script>
+const out = document.getElementById('out');
+document.querySelector('.grid').addEventListener('click', (e) => {{
+  const btn = e.target.closest('button[data-path]');
+  if (btn) callApi(btn.dataset.path);
+}});
 async function callApi(path){{
-  const out = document.getElementById('out');
   out.textContent = 'Loading ' + path + ' ...';
   try {{
     const res = await fetch(path, {{headers: {{'Accept':'application/json'}}}});
@@ -990,6 +1404,54 @@ async function callApi(path){{
 </body></html>"""
 
 
+# Mermaid source of the /fc diagram. Its hash keys the browser-side cache of
+# the rendered SVG, so editing the diagram invalidates every cached render.
+_FC_DIAGRAM = """flowchart TD
+  userNode["User"]
+  webNode["orcest.ai Web"]
+  ssoNode["login.orcest.ai SSO"]
+  orchestrationNode["Orchestration UI"]
+  langchainUiNode["LangChain Console UI"]
+  langchainApiNode["Orcest LangChain API"]
+  manifestNode["RainyModel Manifest"]
+  rainyModelNode["RainyModel Proxy"]
+  providersNode["Model Providers"]
+
+  deepAgentsNode["Deep Agents"]
+  langGraphNode["LangGraph"]
+  integrationsNode["Integrations"]
+  langsmithNode["LangSmith"]
+  deploymentNode["LangSmith Deployment"]
+
+  laminoNode["llm.orcest.ai"]
+  maestristNode["agent.orcest.ai"]
+  orcideNode["ide.orcest.ai"]
+  statusNode["status.orcest.ai"]
+
+  userNode --> webNode
+  webNode -->|"Login"| ssoNode
+  ssoNode --> orchestrationNode
+  orchestrationNode --> langchainUiNode
+
+  langchainUiNode --> langchainApiNode
+  langchainApiNode --> deepAgentsNode
+  langchainApiNode --> langGraphNode
+  langchainApiNode --> integrationsNode
+  langchainApiNode --> langsmithNode
+  langchainApiNode --> deploymentNode
+
+  langchainApiNode --> manifestNode
+  manifestNode --> rainyModelNode
+  rainyModelNode --> providersNode
+
+  webNode --> laminoNode
+  webNode --> maestristNode
+  webNode --> orcideNode
+  webNode --> statusNode
+"""
+_FC_DIAGRAM_KEY = "orcest-fc-svg:mermaid11:" + hashlib.blake2b(_FC_DIAGRAM.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def _fc_html():
     return """<!DOCTYPE html>
 <html lang="en">
@@ -997,10 +1459,9 @@ def _fc_html():
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Orcest System Flowchart</title>
-  <script src="https://cdn.jsdelivr.net/npm/@panzoom/panzoom@4.6.0/dist/panzoom.min.js"></script>
+  <script defer src="https://cdn.jsdelivr.net/npm/@panzoom/panzoom@4.6.0/dist/panzoom.min.js"></script>
   <script type="module">
-    import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@11/dist/mermaid.esm.min.mjs';
-    mermaid.initialize({ startOnLoad: true, theme: 'dark', securityLevel: 'loose' });
+    const MERMAID_URL = 'https://cdn.jsdelivr.net/npm/mermaid@11/dist/mermaid.esm.min.mjs';
 
     function downloadFile(filename, content, mimeType) {
       const blob = new Blob([content], { type: mimeType });
@@ -1014,19 +1475,41 @@ def _fc_html():
       URL.revokeObjectURL(url);
     }
 
-    function setupPanZoomAndExports() {
-      const svg = document.querySelector('.mermaid svg');
+    // The SVG is only ever shown through an <img>, never parsed into this
+    // document, so nothing in it (or in a tampered cache entry) can run.
+    function showDiagram(svgMarkup) {
       const host = document.getElementById('diagramHost');
-      if (!svg || !host || !window.Panzoom) {
-        return;
-      }
+      const img = new Image();
+      img.alt = 'Orcest AI system diagram';
+      img.src = URL.createObjectURL(new Blob([svgMarkup], { type: 'image/svg+xml' }));
+      img.style.width = '100%';
+      img.style.height = 'auto';
+      host.replaceChildren(img);
 
-      host.innerHTML = '';
-      host.appendChild(svg);
-      svg.style.width = '100%';
-      svg.style.height = 'auto';
+      document.getElementById('exportSvgBtn').addEventListener('click', () => {
+        downloadFile('orcest-system-diagram.svg', svgMarkup, 'image/svg+xml;charset=utf-8');
+      });
+
+      document.getElementById('exportPngBtn').addEventListener('click', () => {
+        const canvas = document.createElement('canvas');
+        canvas.width = img.naturalWidth || 1600;
+        canvas.height = img.naturalHeight || 900;
+        const ctx = canvas.getContext('2d');
+        ctx.fillStyle = '#0a0a0f';
+        ctx.fillRect(0, 0, canvas.width, canvas.height);
+        ctx.drawImage(img, 0, 0, canvas.width, canvas.height);
+        const a = document.createElement('a');
+        a.href = canvas.toDataURL('image/png');
+        a.download = 'orcest-system-diagram.png';
+        document.body.appendChild(a);
+        a.click();
+        a.remove();
+      });
 
-      const panzoom = window.Panzoom(svg, {
+      if (!window.Panzoom) {
+        return;
+      }
+      const panzoom = window.Panzoom(img, {
         maxScale: 3.5,
         minScale: 0.4,
         step: 0.2,
@@ -1037,42 +1520,42 @@ def _fc_html():
       document.getElementById('zoomInBtn').addEventListener('click', () => panzoom.zoomIn());
       document.getElementById('zoomOutBtn').addEventListener('click', () => panzoom.zoomOut());
       document.getElementById('resetBtn').addEventListener('click', () => panzoom.reset());
+    }
 
-      document.getElementById('exportSvgBtn').addEventListener('click', () => {
-        const serializer = new XMLSerializer();
-        const svgRaw = serializer.serializeToString(svg);
-        downloadFile('orcest-system-diagram.svg', svgRaw, 'image/svg+xml;charset=utf-8');
-      });
+    // The rendered SVG is kept in localStorage under a key derived on the
+    // server from the diagram source, so repeat visits skip downloading
+    // Mermaid and re-rendering; older renders are dropped when a new one is
+    // stored.
+    const CACHE_PREFIX = 'orcest-fc-svg:';
+    const CACHE_KEY = '__FC_DIAGRAM_KEY__';
+
+    function storeRender(svgMarkup) {
+      try {
+        for (let i = localStorage.length - 1; i >= 0; i--) {
+          const key = localStorage.key(i);
+          if (key && key.startsWith(CACHE_PREFIX) && key !== CACHE_KEY) {
+            localStorage.removeItem(key);
+          }
+        }
+        localStorage.setItem(CACHE_KEY, svgMarkup);
+      } catch (e) {}
+    }
 
-      document.getElementById('exportPngBtn').addEventListener('click', () => {
-        const serializer = new XMLSerializer();
-        const svgRaw = serializer.serializeToString(svg);
-        const svg64 = btoa(unescape(encodeURIComponent(svgRaw)));
-        const image64 = 'data:image/svg+xml;base64,' + svg64;
-        const img = new Image();
-        img.onload = () => {
-          const canvas = document.createElement('canvas');
-          canvas.width = img.width || 1600;
-          canvas.height = img.height || 900;
-          const ctx = canvas.getContext('2d');
-          ctx.fillStyle = '#0a0a0f';
-          ctx.fillRect(0, 0, canvas.width, canvas.height);
-          ctx.drawImage(img, 0, 0);
-          const pngUrl = canvas.toDataURL('image/png');
-          const a = document.createElement('a');
-          a.href = pngUrl;
-          a.download = 'orcest-system-diagram.png';
-          document.body.appendChild(a);
-          a.click();
-          a.remove();
-        };
-        img.src = image64;
-      });
+    async function renderDiagram() {
+      let svgMarkup = null;
+      try {
+        svgMarkup = localStorage.getItem(CACHE_KEY);
+      } catch (e) {}
+      if (!svgMarkup) {
+        const { default: mermaid } = await import(MERMAID_URL);
+        mermaid.initialize({ startOnLoad: false, theme: 'dark', securityLevel: 'strict' });
+        ({ svg: svgMarkup } = await mermaid.render('orcestDiagram', document.querySelector('.mermaid').textContent));
+        storeRender(svgMarkup);
+      }
+      showDiagram(svgMarkup);
     }
 
-    window.addEventListener('load', () => {
-      setTimeout(setupPanZoomAndExports, 350);
-    });
+    renderDiagram();
   </script>
   <style>
     body { margin: 0; background: #0a0a0f; color: #e2e8f0; font-family: system-ui, -apple-system, sans-serif; }
@@ -1084,7 +1567,7 @@ def _fc_html():
     .toolbar button { background: #0f172a; color: #e2e8f0; border: 1px solid #334155; border-radius: 8px; padding: 8px 12px; cursor: pointer; }
     .toolbar button:hover { border-color: #60a5fa; color: #60a5fa; }
     #diagramHost { overflow: hidden; border: 1px dashed #334155; border-radius: 10px; min-height: 380px; display: flex; align-items: center; justify-content: center; padding: 8px; }
-    #diagramHost svg { touch-action: none; cursor: grab; }
+    #diagramHost img { touch-action: none; cursor: grab; }
     .mermaid { display: none; }
     .links { margin-top: 14px; display: flex; gap: 10px; flex-wrap: wrap; }
     .links a { color: #60a5fa; text-decoration: none; border: 1px solid #334155; padding: 8px 12px; border-radius: 8px; }
@@ -1105,49 +1588,7 @@ def _fc_html():
       </div>
       <div id="diagramHost"></div>
       <pre class="mermaid">
-flowchart TD
-  userNode["User"]
-  webNode["orcest.ai Web"]
-  ssoNode["login.orcest.ai SSO"]
-  orchestrationNode["Orchestration UI"]
-  langchainUiNode["LangChain Console UI"]
-  langchainApiNode["Orcest LangChain API"]
-  manifestNode["RainyModel Manifest"]
-  rainyModelNode["RainyModel Proxy"]
-  providersNode["Model Providers"]
-
-  deepAgentsNode["Deep Agents"]
-  langGraphNode["LangGraph"]
-  integrationsNode["Integrations"]
-  langsmithNode["LangSmith"]
-  deploymentNode["LangSmith Deployment"]
-
-  laminoNode["llm.orcest.ai"]
-  maestristNode["agent.orcest.ai"]
-  orcideNode["ide.orcest.ai"]
-  statusNode["status.orcest.ai"]
-
-  userNode --> webNode
-  webNode -->|"Login"| ssoNode
-  ssoNode --> orchestrationNode
-  orchestrationNode --> langchainUiNode
-
-  langchainUiNode --> langchainApiNode
-  langchainApiNode --> deepAgentsNode
-  langchainApiNode --> langGraphNode
-  langchainApiNode --> integrationsNode
-  langchainApiNode --> langsmithNode
-  langchainApiNode --> deploymentNode
-
-  langchainApiNode --> manifestNode
-  manifestNode --> rainyModelNode
-  rainyModelNode --> providersNode
-
-  webNode --> laminoNode
-  webNode --> maestristNode
-  webNode --> orcideNode
-  webNode --> statusNode
-      </pre>
+__FC_DIAGRAM__      </pre>
     </div>
     <div class="links">
       <a href="/orchestration">Orchestration</a>
@@ -1157,61 +1598,180 @@ flowchart TD
     </div>
   </div>
 </body>
-</html>"""
+</html>""".replace("__FC_DIAGRAM_KEY__", _FC_DIAGRAM_KEY).replace("__FC_DIAGRAM__", _FC_DIAGRAM)
+
+
+def _extract_token(request: Request) -> str:
+    token = request.cookies.get(ORCEST_SSO_COOKIE)
+    if token:
+        return token
+    authorization = request.headers.get("Authorization", "")
+    return authorization[7:] if authorization.startswith("Bearer ") else ""
+
+
+class SSORedirect(Exception):
+    """Raised by ``require_sso`` to send an unauthenticated browser to login."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(url)
+        self.url = url
+
+
+@app.exception_handler(SSORedirect)
+async def sso_redirect_handler(request: Request, exc: SSORedirect) -> RedirectResponse:
+    return RedirectResponse(url=exc.url, status_code=302)
+
+
+async def require_sso(request: Request) -> str:
+    """Dependency for SSO-protected pages: the verified token, or a redirect to login."""
+    token = _extract_token(request)
+    if await _is_authenticated_token(request, token):
+        return token
+    raise SSORedirect(_auth_url_with_state(request.scope["path"]))
+
+
+# The pages depend only on module constants, so each is rendered, compressed
+# and hashed once at import. The SSO-protected pages are "private, no-cache":
+# browsers keep a copy but revalidate every time, so the auth check still
+# runs before any 304, and shared caches never store them.
+_ORCHESTRATION_PAGE = PrecompressedBody(_orchestration_html(), "text/html; charset=utf-8", "private, no-cache")
+_LANGCHAIN_CONSOLE_PAGE = PrecompressedBody(_langchain_console_html(), "text/html; charset=utf-8", "private, no-cache")
+_RAINYMODEL_CONSOLE_PAGE = PrecompressedBody(_rainymodel_console_html(), "text/html; charset=utf-8", "private, no-cache")
+_FC_PAGE = PrecompressedBody(_fc_html(), "text/html; charset=utf-8", "public, max-age=300")
 
 
 @app.get("/orchestration", response_class=HTMLResponse)
-async def orchestration_page(request: Request):
+async def orchestration_page(request: Request, _: str = Depends(require_sso)):
     """Orcest AI Orchestration - LangChain-based service (requires SSO)"""
-    token = request.cookies.get(ORCEST_SSO_COOKIE) or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if await _is_authenticated_token(token):
-        return HTMLResponse(content=_orchestration_html())
-    return RedirectResponse(url=_auth_url_with_state("/orchestration"), status_code=302)
+    return _ORCHESTRATION_PAGE.response(request)
 
 
 @app.get("/orchestration/langchain", response_class=HTMLResponse)
-async def langchain_console_page(request: Request):
+async def langchain_console_page(request: Request, _: str = Depends(require_sso)):
     """SSO-protected simple UI for internal LangChain component access."""
-    token = request.cookies.get(ORCEST_SSO_COOKIE) or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if await _is_authenticated_token(token):
-        return HTMLResponse(content=_langchain_console_html())
-    return RedirectResponse(url=_auth_url_with_state("/orchestration/langchain"), status_code=302)
+    return _LANGCHAIN_CONSOLE_PAGE.response(request)
 
 
 @app.get("/orchestration/rainymodel", response_class=HTMLResponse)
-async def rainymodel_console_page(request: Request):
+async def rainymodel_console_page(request: Request, _: str = Depends(require_sso)):
     """SSO-protected console for RainyModel manifest and access map usage."""
-    token = request.cookies.get(ORCEST_SSO_COOKIE) or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if await _is_authenticated_token(token):
-        return HTMLResponse(content=_rainymodel_console_html())
-    return RedirectResponse(url=_auth_url_with_state("/orchestration/rainymodel"), status_code=302)
+    return _RAINYMODEL_CONSOLE_PAGE.response(request)
+
+
+_SSO_AUTHORIZE_URL_PREFIX = (
+    f"{SSO_ISSUER}/oauth2/authorize?client_id={SSO_CLIENT_ID}"
+    f"&redirect_uri={SSO_CALLBACK_URL}&response_type=code&scope=openid%20profile%20email"
+    "&state="
+)
 
 
+# Only the three /orchestration paths are ever passed in, so every redirect
+# after the first per path is a cache hit.
+@lru_cache(maxsize=16)
 def _auth_url_with_state(return_to: str) -> str:
-    state_obj = {"returnTo": return_to}
-    state_raw = json.dumps(state_obj).encode("utf-8")
-    encoded_state = base64.urlsafe_b64encode(state_raw).decode("utf-8").rstrip("=")
-    return (
-        f"{SSO_ISSUER}/oauth2/authorize?client_id={SSO_CLIENT_ID}"
-        f"&redirect_uri={SSO_CALLBACK_URL}&response_type=code&scope=openid%20profile%20email"
-        f"&state={encoded_state}"
-    )
+    state_raw = orjson.dumps({"returnTo": return_to})
+    return _SSO_AUTHORIZE_URL_PREFIX + base64.urlsafe_b64encode(state_raw).rstrip(b"=").decode("ascii")
+
 
+def _remember_sso_token(key: bytes) -> None:
+    if len(_sso_token_cache) >= SSO_TOKEN_CACHE_MAX:
+        del _sso_token_cache[next(iter(_sso_token_cache))]
+    _sso_token_cache[key] = time.monotonic() + SSO_TOKEN_CACHE_TTL
 
-async def _is_authenticated_token(token: str) -> bool:
+
+async def _verify_sso_token(client: httpx.AsyncClient, token: str, key: bytes) -> bool:
+    try:
+        verify_res = await client.post(
+            "/api/token/verify",
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        )
+        valid = False
+        if verify_res.status_code == 200:
+            try:
+                valid = bool(orjson.loads(verify_res.content).get("valid"))
+            except (orjson.JSONDecodeError, AttributeError):
+                pass
+        _sso_token_cache.pop(key, None)
+        if valid:
+            _remember_sso_token(key)
+        return valid
+    finally:
+        del _sso_verify_inflight[key]
+
+
+async def _is_authenticated_token(request: Request, token: str) -> bool:
     if not token and not SSO_CLIENT_SECRET:
         return True
     if not token or not SSO_CLIENT_SECRET:
         return False
-    async with httpx.AsyncClient() as client:
-        verify_res = await client.post(
-            f"{SSO_ISSUER}/api/token/verify",
-            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    expires_at = _sso_token_cache.get(key)
+    if expires_at is not None and expires_at > time.monotonic():
+        return True
+    # Single-flight: concurrent requests carrying the same uncached token
+    # share one verify call. shield() keeps a disconnecting client from
+    # cancelling the call for everyone else waiting on it.
+    task = _sso_verify_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_verify_sso_token(request.app.state.sso_http, token, key))
+        _sso_verify_inflight[key] = task
+    return await asyncio.shield(task)
+
+
+@app.api_route("/fc", methods=["GET", "HEAD"], response_class=HTMLResponse)
+async def flowchart_page(request: Request):
+    """Public flowchart page for system architecture."""
+    return _FC_PAGE.response(request)
+
+
+def _json_bytes_response(body: bytes) -> Callable[[Request], Response]:
+    return lambda request: Response(body, media_type="application/json")
+
+
+def _timestamped_response(entry: TimestampedJSON) -> Callable[[Request], Response]:
+    return lambda request: entry.response()
+
+
+# Same responses as the route handlers above, for FastPathMiddleware.
+_FAST_GET_ROUTES.update(
+    {
+        b"/": (_LANDING_PAGE.response, True),
+        b"/health": (_json_bytes_response(_HEALTH_JSON), False),
+        b"/api/info": (_json_bytes_response(_API_INFO_JSON), True),
+        b"/api/langchain/health": (_timestamped_response(_LANGCHAIN_HEALTH), True),
+        b"/api/langchain/ecosystem": (_LANGCHAIN_ECOSYSTEM.response, True),
+        b"/api/rainymodel/langchain-manifest": (_RAINYMODEL_MANIFEST.response, True),
+        b"/api/rainymodel/langchain-manifest/schema": (_MANIFEST_SCHEMA.response, True),
+        b"/fc": (_FC_PAGE.response, True),
+        **{
+            b"/api/langchain/" + slug.encode(): (_timestamped_response(entry), True)
+            for slug, entry in _LANGCHAIN_COMPONENTS.items()
+        },
+    }
+)
+
+
+def _check_fast_path_routes() -> None:
+    """Fail at import if _FAST_GET_ROUTES has drifted from the router.
+
+    Every fast-path entry must resolve, in registration order, to an APIRoute
+    that answers GET and HEAD, has no dependencies the fast path would skip,
+    and is counted exactly when CountingRoute would count it.
+    """
+    for raw_path, (_, counted) in _FAST_GET_ROUTES.items():
+        path = raw_path.decode("ascii")
+        route = next(
+            (r for r in app.router.routes if isinstance(r, APIRoute) and r.path_regex.match(path)),
+            None,
         )
-    return verify_res.status_code == 200 and verify_res.json().get("valid")
+        if route is None:
+            raise RuntimeError(f"fast path {path} has no matching route")
+        if not {"GET", "HEAD"} <= route.methods:
+            raise RuntimeError(f"fast path {path} serves GET and HEAD but route {route.path} allows {sorted(route.methods)}")
+        if route.dependant.dependencies:
+            raise RuntimeError(f"fast path {path} would skip the dependencies of route {route.path}")
+        if counted != (route.path not in _UNCOUNTED_PATHS):
+            raise RuntimeError(f"fast path {path} and route {route.path} disagree on request counting")
 
 
-@app.get("/fc", response_class=HTMLResponse)
-async def flowchart_page():
-    """Public flowchart page for system architecture."""
-    return HTMLResponse(content=_fc_html())
+_check_fast_path_routes()
@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+
+ORIGIN = "https://client.example"
+
+
+def test_preflight_is_answered_without_reaching_the_app(client: TestClient) -> None:
+    response = client.options(
+        "/api/langchain/agent/run",
+        headers={
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, x-trace",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "content-type, x-trace"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-max-age"] == "86400"
+    assert response.headers["vary"].startswith("Origin")
+
+
+def test_options_without_preflight_headers_reaches_the_app(client: TestClient) -> None:
+    assert client.options("/api/info").status_code == 405
+
+
+def test_simple_request_without_cookie_gets_wildcard(client: TestClient) -> None:
+    response = client.get("/api/info", headers={"Origin": ORIGIN})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in response.headers
+
+
+def test_simple_request_with_cookie_gets_echoed_origin(client: TestClient) -> None:
+    response = client.get("/api/info", headers={"Origin": ORIGIN, "Cookie": "orcest_sso_token=t"})
+
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_routed_request_with_cookie_gets_echoed_origin(client: TestClient) -> None:
+    response = client.post(
+        "/api/langchain/agent/run",
+        json={"query": "hi"},
+        headers={"Origin": ORIGIN, "Cookie": "orcest_sso_token=t"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+
+def test_request_without_origin_gets_no_cors_headers(client: TestClient) -> None:
+    response = client.get("/api/info")
+
+    assert "access-control-allow-origin" not in response.headers
+    assert "access-control-allow-credentials" not in response.headers
+
+
+def test_vary_origin_is_added(client: TestClient) -> None:
+    for headers in ({}, {"Origin": ORIGIN}, {"Origin": ORIGIN, "Cookie": "a=b"}):
+        assert client.get("/api/info", headers=headers).headers["vary"] == "Origin"
+
+
+def test_vary_origin_is_appended_to_existing_vary(client: TestClient) -> None:
+    response = client.get("/", headers={"Origin": ORIGIN})
+
+    assert response.headers["vary"] == "Accept-Encoding, Origin"
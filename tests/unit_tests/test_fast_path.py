@@ -0,0 +1,32 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+def test_fast_path_table_matches_router() -> None:
+    main._check_fast_path_routes()
+
+
+def test_fast_path_drift_is_detected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(main._FAST_GET_ROUTES, b"/orchestration", (main._LANDING_PAGE.response, True))
+    with pytest.raises(RuntimeError, match="/orchestration"):
+        main._check_fast_path_routes()
+
+
+@pytest.mark.parametrize("raw_path", sorted(main._FAST_GET_ROUTES))
+@pytest.mark.parametrize("method", ["GET", "HEAD"])
+def test_fast_path_serves_what_the_router_serves(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, raw_path: bytes, method: str
+) -> None:
+    path = raw_path.decode("ascii")
+    headers = {"Accept-Encoding": "identity"}
+    fast = client.request(method, path, headers=headers)
+    monkeypatch.setattr(main, "_FAST_GET_ROUTES", {})
+    routed = client.request(method, path, headers=headers)
+
+    assert fast.status_code == routed.status_code == 200
+    assert fast.headers.get("etag") == routed.headers.get("etag")
+    assert fast.headers["content-type"] == routed.headers["content-type"]
+    if b"timestamp" not in fast.content and b"updated_at" not in fast.content:
+        assert fast.content == routed.content
@@ -0,0 +1,102 @@
+import brotli
+import gzip
+
+import pytest
+from starlette.requests import Request
+
+from app.main import PrecompressedBody, _accepted_encodings
+
+BODY = b'{"hello":"world"}' * 20
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.fixture
+def body() -> PrecompressedBody:
+    return PrecompressedBody(BODY, "application/json", "public, max-age=60")
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+        ("br;q=0, gzip", {"gzip"}),
+        ("BR ; q=0.5", {"br"}),
+        ("br;q=0.0, gzip;q=0", set()),
+        ("gzip;q=bogus, br", {"br"}),
+        ("", set()),
+    ],
+)
+def test_accepted_encodings(accept_encoding: str, expected: set[str]) -> None:
+    assert _accepted_encodings(accept_encoding) == expected
+
+
+def test_prefers_brotli(body: PrecompressedBody) -> None:
+    response = body.response(_request(accept_encoding="gzip, br"))
+
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(response.body) == BODY
+
+
+def test_falls_back_to_gzip(body: PrecompressedBody) -> None:
+    response = body.response(_request(accept_encoding="gzip"))
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body) == BODY
+
+
+def test_identity_without_accept_encoding(body: PrecompressedBody) -> None:
+    response = body.response(_request())
+
+    assert "content-encoding" not in response.headers
+    assert response.body == BODY
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [("br;q=0, gzip", "gzip"), ("br;q=0, gzip;q=0", None), ("gzip;q=0, br", "br")],
+)
+def test_q_zero_excludes_a_coding(body: PrecompressedBody, accept_encoding: str, expected: str | None) -> None:
+    response = body.response(_request(accept_encoding=accept_encoding))
+
+    assert response.headers.get("content-encoding") == expected
+
+
+def test_variants_share_validators(body: PrecompressedBody) -> None:
+    for accept_encoding in ("br", "gzip", ""):
+        response = body.response(_request(accept_encoding=accept_encoding))
+        assert response.headers["etag"] == body.etag
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        lambda b: b.etag,
+        lambda b: b.opaque_tag,
+        lambda b: "*",
+        lambda b: f'W/"other", {b.etag}',
+        lambda b: f'"other",{b.opaque_tag}',
+    ],
+    ids=["weak", "strong", "star", "weak-in-list", "strong-in-list"],
+)
+def test_not_modified(body: PrecompressedBody, if_none_match) -> None:
+    if_none_match = if_none_match(body)
+
+    response = body.response(_request(if_none_match=if_none_match, accept_encoding="br"))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == body.etag
+
+
+@pytest.mark.parametrize("if_none_match", ['"other"', 'W/"other"', "W/", ""])
+def test_modified(body: PrecompressedBody, if_none_match: str) -> None:
+    response = body.response(_request(if_none_match=if_none_match))
+
+    assert response.status_code == 200
+    assert response.body == BODY
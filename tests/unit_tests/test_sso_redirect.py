@@ -0,0 +1,17 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+@pytest.mark.parametrize("path", ["/orchestration", "/orchestration/langchain", "/orchestration/rainymodel"])
+def test_unauthenticated_page_redirects_to_login(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    monkeypatch.setattr(main, "SSO_CLIENT_SECRET", "secret")
+
+    response = client.get(path, follow_redirects=False)
+
+    assert response.status_code == 302
+    assert response.headers["location"] == main._auth_url_with_state(path)
+    assert response.headers["location"].startswith(f"{main.SSO_ISSUER}/oauth2/authorize?")